@@ -4,20 +4,95 @@ HTML Report Generator for Compliance Tool
 """
 
 from datetime import datetime
+from html import escape
+
+# Per-item HTML templates, filled with %-formatting once per check result
+_TAG_TMPL = '                    <span class="framework-tag">%s</span>\n'
+
+_FAIL_ITEM_TMPL = """
+            <div class="check-item fail">
+                <div class="check-header">
+                    <div class="check-name">%(check)s</div>
+                    <div class="check-status fail">FAIL</div>
+                </div>
+                <div class="check-message">%(message)s</div>
+                <div class="remediation">
+                    <strong>🔧 Remediation:</strong>
+                    %(remediation)s
+                </div>
+                <div class="frameworks">
+%(frameworks)s
+                </div>
+            </div>
+"""
+
+_PASS_ITEM_TMPL = """
+            <div class="check-item pass">
+                <div class="check-header">
+                    <div class="check-name">%(check)s</div>
+                    <div class="check-status pass">PASS</div>
+                </div>
+                <div class="check-message">%(message)s</div>
+                <div class="frameworks">
+%(frameworks)s
+                </div>
+            </div>
+"""
+
+_WARNING_ITEM_TMPL = """
+            <div class="check-item warning">
+                <div class="check-header">
+                    <div class="check-name">%(check)s</div>
+                    <div class="check-status warning">WARNING</div>
+                </div>
+                <div class="check-message">%(message)s</div>
+                <div class="frameworks">
+%(frameworks)s
+                </div>
+            </div>
+"""
+
+_SECTION_HEAD_TMPL = """
+        <div class="section">
+            <h2>%s</h2>
+"""
+
+# (results key, section heading, item template) for each rendered section
+_SECTIONS = (
+    ('failed', '❌ Failed Checks (Action Required)', _FAIL_ITEM_TMPL),
+    ('passed', '✅ Passed Checks', _PASS_ITEM_TMPL),
+    ('warnings', '⚠️ Warnings', _WARNING_ITEM_TMPL),
+)
 
 class ReportGenerator:
-    def __init__(self, results, system_info):
+    def __init__(self, results, system_info, generated_at=None, summary=None):
         self.results = results
         self.system_info = system_info
+        self.generated_at = generated_at or datetime.now()
+        # Optional precomputed (passed, failed, warnings, total, score)
+        self.summary = summary
         
     def generate_html(self, filename='compliance_report.html'):
         """Generate HTML compliance report"""
+        with open(filename, 'w', buffering=1 << 16) as f:
+            self.write_html(f)
         
-        total = len(self.results['passed']) + len(self.results['failed']) + len(self.results['warnings'])
-        passed = len(self.results['passed'])
-        failed = len(self.results['failed'])
-        warnings = len(self.results['warnings'])
-        score = (passed / total * 100) if total > 0 else 0
+        print(f"📊 HTML report generated: {filename}")
+        return filename
+    
+    def write_html(self, f):
+        """Stream the HTML report to an open text file, fragment by fragment"""
+        write = f.write
+        
+        if self.summary is not None:
+            passed, failed, warnings, total, score = self.summary
+        else:
+            passed = len(self.results['passed'])
+            failed = len(self.results['failed'])
+            warnings = len(self.results['warnings'])
+            total = passed + failed + warnings
+            score = (passed / total * 100) if total > 0 else 0
+        generated = self.generated_at.strftime('%B %d, %Y at %I:%M %p')
         
         # Determine status color
         if score >= 90:
@@ -33,7 +108,11 @@ class ReportGenerator:
             status_color = '#dc3545'  # Red
             status_text = 'CRITICAL'
         
-        html = f"""
+        # Pre-format values spliced into the page template
+        score_deg = f"{score * 3.6:.2f}deg"
+        score_pct = f"{score:.0f}%"
+        
+        write(f"""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -126,8 +205,8 @@ class ReportGenerator:
             border-radius: 50%;
             background: conic-gradient(
                 {status_color} 0deg,
-                {status_color} {score * 3.6}deg,
-                #e9ecef {score * 3.6}deg,
+                {status_color} {score_deg},
+                #e9ecef {score_deg},
                 #e9ecef 360deg
             );
             display: flex;
@@ -288,7 +367,7 @@ class ReportGenerator:
     <div class="container">
         <div class="header">
             <h1>🔒 Security Compliance Audit Report</h1>
-            <p>System: {self.system_info} | Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
+            <p>System: {self.system_info} | Generated: {generated}</p>
         </div>
         
         <div class="summary">
@@ -312,104 +391,34 @@ class ReportGenerator:
         
         <div class="score">
             <div class="score-circle">
-                <div class="score-text">{score:.0f}%</div>
+                <div class="score-text">{score_pct}</div>
             </div>
             <div class="status-badge">{status_text}</div>
         </div>
-"""
-        
-        # Failed checks section
-        if failed > 0:
-            html += """
-        <div class="section">
-            <h2>❌ Failed Checks (Action Required)</h2>
-"""
-            for item in self.results['failed']:
-                html += f"""
-            <div class="check-item fail">
-                <div class="check-header">
-                    <div class="check-name">{item['check']}</div>
-                    <div class="check-status fail">FAIL</div>
-                </div>
-                <div class="check-message">{item['message']}</div>
-                <div class="remediation">
-                    <strong>🔧 Remediation:</strong>
-                    {item['remediation']}
-                </div>
-                <div class="frameworks">
-"""
-                for fw in item['frameworks']:
-                    html += f'                    <span class="framework-tag">{fw}</span>\n'
-                
-                html += """
-                </div>
-            </div>
-"""
-            html += "        </div>\n"
-        
-        # Passed checks section
-        if passed > 0:
-            html += """
-        <div class="section">
-            <h2>✅ Passed Checks</h2>
-"""
-            for item in self.results['passed']:
-                html += f"""
-            <div class="check-item pass">
-                <div class="check-header">
-                    <div class="check-name">{item['check']}</div>
-                    <div class="check-status pass">PASS</div>
-                </div>
-                <div class="check-message">{item['message']}</div>
-                <div class="frameworks">
-"""
-                for fw in item['frameworks']:
-                    html += f'                    <span class="framework-tag">{fw}</span>\n'
-                
-                html += """
-                </div>
-            </div>
-"""
-            html += "        </div>\n"
-        
-        # Warnings section
-        if warnings > 0:
-            html += """
-        <div class="section">
-            <h2>⚠️ Warnings</h2>
-"""
-            for item in self.results['warnings']:
-                html += f"""
-            <div class="check-item warning">
-                <div class="check-header">
-                    <div class="check-name">{item['check']}</div>
-                    <div class="check-status warning">WARNING</div>
-                </div>
-                <div class="check-message">{item['message']}</div>
-                <div class="frameworks">
-"""
-                for fw in item['frameworks']:
-                    html += f'                    <span class="framework-tag">{fw}</span>\n'
-                
-                html += """
-                </div>
-            </div>
-"""
-            html += "        </div>\n"
+""")
+        
+        # Check sections, in display order
+        for key, heading, item_tmpl in _SECTIONS:
+            items = self.results[key]
+            if not items:
+                continue
+            write(_SECTION_HEAD_TMPL % heading)
+            for item in items:
+                write(item_tmpl % {
+                    'check': escape(item['check']),
+                    'message': escape(item['message']),
+                    'remediation': escape(item.get('remediation', '')),
+                    'frameworks': ''.join(_TAG_TMPL % escape(fw) for fw in item['frameworks'])
+                })
+            write("        </div>\n")
         
         # Footer
-        html += f"""
+        write(f"""
         <div class="footer">
             <p>Compliance Automation Tool | Frameworks: CIS, NIST, ISO 27001</p>
-            <p>Report generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
+            <p>Report generated on {generated}</p>
         </div>
     </div>
 </body>
 </html>
-"""
-        
-        with open(filename, 'w') as f:
-            f.write(html)
-        
-        print(f"📊 HTML report generated: {filename}")
-        return filename
\ No newline at end of file
+""")
\ No newline at end of file